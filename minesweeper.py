@@ -1,6 +1,44 @@
+import functools
 import itertools
 import random
 
+from collections import deque
+
+# Set to True to trace the AI's reasoning on stdout
+DEBUG = False
+
+
+@functools.lru_cache(maxsize=None)
+def _neighbor_table(height, width):
+    """
+    Returns, for each cell id `i * width + j` of a `height` x `width`
+    board, a tuple of the ids of its neighbors, clipped to the board.
+    Boards of the same shape share one table.
+    """
+    table = []
+    for i in range(height):
+        rows = range(max(0, i - 1), min(height, i + 2))
+        for j in range(width):
+            cols = range(max(0, j - 1), min(width, j + 2))
+            table.append(tuple(
+                ni * width + nj for ni in rows for nj in cols
+                if (ni, nj) != (i, j)
+            ))
+    return tuple(table)
+
+
+def _count_all_neighbors(height, width, mines):
+    """
+    Returns a flat, row-major bytearray holding the number of mines
+    adjacent to each cell of a `height` x `width` board.
+    """
+    neighbors = _neighbor_table(height, width)
+    counts = bytearray(height * width)
+    for i, j in mines:
+        for neighbor in neighbors[i * width + j]:
+            counts[neighbor] += 1
+    return counts
+
 
 class Minesweeper():
     """
@@ -14,21 +52,19 @@ class Minesweeper():
         self.width = width
         self.mines = set()
 
-        # Initialize an empty field with no mines
-        self.board = []
-        for i in range(self.height):
-            row = []
-            for j in range(self.width):
-                row.append(False)
-            self.board.append(row)
+        # Initialize an empty field with no mines, one bit per cell
+        self.bits = 0
 
         # Add mines randomly
         while len(self.mines) != mines:
             i = random.randrange(height)
             j = random.randrange(width)
-            if not self.board[i][j]:
+            if not self.is_mine((i, j)):
                 self.mines.add((i, j))
-                self.board[i][j] = True
+                self.bits |= 1 << (i * width + j)
+
+        # Number of neighboring mines for every cell, row by row
+        self.mine_counts = _count_all_neighbors(height, width, self.mines)
 
         # At first, player has found no mines
         self.mines_found = set()
@@ -41,7 +77,7 @@ class Minesweeper():
         for i in range(self.height):
             print("--" * self.width + "-")
             for j in range(self.width):
-                if self.board[i][j]:
+                if self.is_mine((i, j)):
                     print("|X", end="")
                 else:
                     print("| ", end="")
@@ -50,7 +86,7 @@ class Minesweeper():
 
     def is_mine(self, cell):
         i, j = cell
-        return self.board[i][j]
+        return bool((self.bits >> (i * self.width + j)) & 1)
 
     def nearby_mines(self, cell):
         """
@@ -58,24 +94,8 @@ class Minesweeper():
         within one row and column of a given cell,
         not including the cell itself.
         """
-
-        # Keep count of nearby mines
-        count = 0
-
-        # Loop over all cells within one row and column
-        for i in range(cell[0] - 1, cell[0] + 2):
-            for j in range(cell[1] - 1, cell[1] + 2):
-
-                # Ignore the cell itself
-                if (i, j) == cell:
-                    continue
-
-                # Update count if cell in bounds and is mine
-                if 0 <= i < self.height and 0 <= j < self.width:
-                    if self.board[i][j]:
-                        count += 1
-
-        return count
+        i, j = cell
+        return self.mine_counts[i * self.width + j]
 
     def won(self):
         """
@@ -91,14 +111,19 @@ class Sentence():
     and a count of the number of those cells which are mines.
     """
 
+    __slots__ = ("cells", "count", "is_mine")
+
     def __init__(self, cells, count, is_mine):
-        self.cells = set(cells)
+        self.cells = frozenset(cells)
         self.count = count
         self.is_mine = is_mine
 
     def __eq__(self, other):
         return self.cells == other.cells and self.count == other.count
 
+    def __hash__(self):
+        return hash((self.cells, self.count))
+
     def __str__(self):
         return f"(status: {'mine' if self.is_mine else 'safe'}{self.cells} = {self.count})"
 
@@ -140,6 +165,8 @@ class MinesweeperAI():
         self.height = height
         self.width = width
 
+        # Cells are tracked as integer ids, `i * width + j`; see encode()
+
         # Keep track of which cells have been clicked on
         self.moves_made = set()
 
@@ -147,24 +174,109 @@ class MinesweeperAI():
         self.mines = set()
         self.safes = set()
 
-        # List of sentences about the game known to be true
-        self.knowledge = {}
+        # Keep track of safe cells that have not been clicked on yet,
+        # kept equal to safes - moves_made as either set changes
+        self.unexplored_safes = set()
+
+        # Keep track of cells neither clicked on nor known to be mines
+        self.available = set(range(height * width))
+
+        # Sentences about the game known to be true, indexed by the
+        # cell they were learned from (None where nothing is known)
+        self.knowledge = [None] * (height * width)
+
+        # Mine count of every stored sentence, keyed by its cells, so
+        # that a sentence already known is never stored twice
+        self.knowledge_by_sig = {}
+
+        # Cells adjacent to each cell, clipped to the board
+        self._neighbors = _neighbor_table(height, width)
+
+    def encode(self, cell):
+        """
+        Returns the id of an `(i, j)` cell.
+        """
+        i, j = cell
+        return i * self.width + j
+
+    def decode(self, cell_id):
+        """
+        Returns the `(i, j)` cell for a cell id.
+        """
+        return divmod(cell_id, self.width)
 
     def mark_mine(self, cell):
         """
-        Marks a cell as a mine, and updates all knowledge
+        Marks a cell id as a mine, and updates all knowledge
         to mark that cell as a mine as well.
         """
-        self.mines.add(cell)
-        print(f"running add knowledge for a known mine at {cell}")
-        self.add_knowledge(cell, 0, True) 
+        self._mark_mines(deque((cell,)))
+
+    def _mark_mines(self, work):
+        """
+        Drains `work`, a deque of cell ids that are mines, marking each
+        one and queueing any further mines its sentences reveal.
+        """
+        while work:
+            mine = work.popleft()
+            if mine in self.mines:
+                continue
+            if DEBUG:
+                print(f"Marking known mine at {mine}")
+            self.mines.add(mine)
+            self.available.discard(mine)
+            self._scan_neighbors(mine, True, work)
+
+    def _scan_neighbors(self, cell, is_mine, work):
+        """
+        Removes `cell`, now known to be a mine or safe, from the sentences
+        learned from its neighbors (the only ones that can mention it).
+        Cells those sentences prove safe are marked safe, and cells they
+        prove to be mines are appended to the `work` deque.
+        """
+        knowledge = self.knowledge
+        for neighbor in self._neighbors[cell]:
+            sentence = knowledge[neighbor]
+            if sentence is None or cell not in sentence.cells:
+                continue
+            cells = sentence.cells.difference((cell,))
+            count = sentence.count - is_mine
+            self._store_sentence(neighbor, cells, count)
+            if DEBUG:
+                print(f"Sentence for {neighbor} reduced to {cells} = {count}")
+            if count == 0:
+                for item in cells:
+                    self.mark_safe(item)
+            elif len(cells) == count:
+                work.extend(cells)
+
+    def _store_sentence(self, cell, cells, count):
+        """
+        Replaces the sentence learned from `cell` with `cells` = `count`.
+        Nothing is stored if `cells` is empty or another sentence
+        already says the same thing.
+        """
+        knowledge, by_sig = self.knowledge, self.knowledge_by_sig
+        old = knowledge[cell]
+        if old is not None:
+            del by_sig[old.cells]
+
+        if cells and cells not in by_sig:
+            by_sig[cells] = count
+            knowledge[cell] = Sentence(cells, count, False)
+        else:
+            knowledge[cell] = None
 
     def mark_safe(self, cell):
         """
-        Marks a cell as safe, and updates all knowledge
+        Marks a cell id as safe, and updates all knowledge
         to mark that cell as safe as well.
         """
+        if cell in self.safes:
+            return
         self.safes.add(cell)
+        if cell not in self.moves_made:
+            self.unexplored_safes.add(cell)
 
     def add_knowledge(self, cell, count, is_mine):
         """
@@ -181,85 +293,87 @@ class MinesweeperAI():
             5) add any new sentences to the AI's knowledge base
                if they can be inferred from existing knowledge
         """
-        print(f"add_knowledged evoked for cell: {cell}")
+        cell = self.encode(cell)
+        if is_mine:
+            self.mark_mine(cell)
+            return
+
+        if DEBUG:
+            print(f"add_knowledged evoked for cell: {cell}")
         self.moves_made.add(cell)
-        x, y = cell
-        neighbors = set()
-        mines = set()
-        for i in range(max(0, x-1), min(self.width, x+2)):
-            for j in range(max(0, y-1), min(self.height, y+2)):
-                neighbor = (i, j)
-                neighbors.add((i,j))
-                print(f"Neighbor: {neighbor}")
-                if neighbor in self.knowledge:
-                    sentence = self.knowledge[(i,j)]
-                    if sentence.is_mine == True:
-                        print(f"Count reduced for self at {cell} to {count - 1}")
-                        if count:
-                            count -= 1
-                    else:
-                        print(
-                            f"Setence for {neighbor} was read as not a mine. Actual sentence: {sentence}"
-                        )
-
-                    if cell in sentence.cells:
-
-                        sentence.cells.remove(cell)
-
-                        if is_mine:
-                            print(
-                                f"reduced {neighbor} count from {sentence.count} to {sentence.count - 1}"
-                            )
-                            sentence.count -= 1
-                            if sentence.count == 0:
-                                print(f"Safe space(s) added from sentence: {sentence}")
-                                for item in sentence.cells:
-                                    print(f"CELL: {item} MARKED AS SAFE")
-                                    self.mark_safe(item)
-                            continue
-                        else:
-                            print(f"is_mine read as False for {neighbor}")
-                            if len(sentence.cells) == sentence.count and len(sentence.cells) > 0:
-                                discovered_mines = sentence.cells.copy()
-                                print(f"Recognized mines: {discovered_mines} by square: {neighbor}")
-                                for mine in discovered_mines:
-                                    print(f"Mine: {mine}")
-                                    mines.add(mine)
-
-                    else:
-                        print(f"Did not find self within knowledge keys: {self.knowledge.keys()} at: {neighbor}")
-                else:
-                    print(f"No sentence exists for neighbor: {neighbor}")
+        self.unexplored_safes.discard(cell)
+        self.available.discard(cell)
+        mines = deque()
+        self._scan_neighbors(cell, False, mines)
 
-        neighbors = neighbors - self.moves_made - self.mines
+        # Known mines and played cells are left out of the new sentence
+        neighbor_cells = self._neighbors[cell]
+        count -= len(self.mines.intersection(neighbor_cells))
+        neighbors = frozenset(neighbor_cells).difference(self.moves_made, self.mines)
 
-        self.knowledge[cell] = Sentence(neighbors, count, is_mine)
-        print(f"original sentence for {cell}: {self.knowledge[cell]}")
+        self._store_sentence(cell, neighbors, count)
+        if DEBUG:
+            print(f"original sentence for {cell}: {self.knowledge[cell]}")
 
         if len(neighbors) == count and count:
-            print(f"Recognized mines: {neighbors} by cell: {cell}")
-            for neighbor in neighbors:
-                print(f"Mark mine called for: {neighbor}")
-                mines.add(neighbor)
-        elif count == 0 and not is_mine:
+            if DEBUG:
+                print(f"Recognized mines: {neighbors} by cell: {cell}")
+            mines.extend(neighbors)
+        elif count == 0:
             for neighbor in neighbors:
-                print(f"cell: {neighbor} marked as safe")
+                if DEBUG:
+                    print(f"cell: {neighbor} marked as safe")
                 self.mark_safe(neighbor)
 
-        for mine in mines:
-            self.mark_mine(mine)
+        self._mark_mines(mines)
 
-        print('\n\n\n')
+        self._infer_from_subsets()
+
+        if DEBUG:
+            print('\n\n\n')
+
+    def _infer_from_subsets(self):
+        """
+        Once no safe move is left, looks for pairs of sentences where
+        one's cells are a subset of the other's: the remaining cells then
+        hold the difference of the two counts, which can reveal safes or
+        mines that no single sentence shows.
+        """
+        while not self.unexplored_safes:
+            inference = self._find_subset_inference()
+            if inference is None:
+                return
+            cells, count = inference
+            if DEBUG:
+                print(f"Inferred {cells} = {count} from a subset sentence")
+            if count:
+                self._mark_mines(deque(cells))
+            else:
+                for item in cells:
+                    self.mark_safe(item)
+
+    def _find_subset_inference(self):
+        """
+        Returns the cells and count of the first sentence derived from a
+        subset that settles all of its cells, or None if there is none.
+        """
+        sentences = self.knowledge_by_sig.items()
+        for small, small_count in sentences:
+            for big, big_count in sentences:
+                if small < big:
+                    cells = big - small
+                    count = big_count - small_count
+                    if count == 0 or len(cells) == count:
+                        return cells, count
+        return None
 
     def make_safe_move(self):
-        unexplored_safes = self.safes - self.moves_made
-        if unexplored_safes:
-            safe_move = random.sample(unexplored_safes, 1)[0]
-            print(f"safe move played at: {safe_move}")
+        if self.unexplored_safes:
+            safe_move = self.decode(next(iter(self.unexplored_safes)))
+            if DEBUG:
+                print(f"safe move played at: {safe_move}")
             return safe_move
 
     def make_random_move(self):
-        for i in range(0,7):
-            for j in range(0,7):
-                if not (i, j) in self.moves_made:
-                    return (i,j)
+        if self.available:
+            return self.decode(random.choice(tuple(self.available)))
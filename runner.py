@@ -184,7 +184,7 @@ while True:
             if move is None:
                 move = ai.make_random_move()
                 if move is None:
-                    flags = ai.mines.copy()
+                    flags = {ai.decode(mine) for mine in ai.mines}
                     print("No moves left to make.")
                 else:
                     print("No known safe moves, AI making random move.")
@@ -218,6 +218,6 @@ while True:
             nearby = game.nearby_mines(move)
             revealed.add(move)
             ai.add_knowledge(move, nearby, False)
-            flags.update(ai.mines)
+            flags.update(ai.decode(mine) for mine in ai.mines)
 
     pygame.display.flip()